@@ -56,6 +56,20 @@ def benchmark():
         serializer.deserialize(schema, k_bin)
     k_des_time = (time.time() - start) / ITERATIONS
 
+    # --- KRYONIX (Whole-Record Compression) ---
+    # Warmup
+    serializer.serialize(schema, data, record_codec=CODEC_ZSTD)
+
+    start = time.time()
+    for _ in range(ITERATIONS):
+        kr_bin = serializer.serialize(schema, data, record_codec=CODEC_ZSTD)
+    kr_ser_time = (time.time() - start) / ITERATIONS
+
+    start = time.time()
+    for _ in range(ITERATIONS):
+        serializer.deserialize(schema, kr_bin)
+    kr_des_time = (time.time() - start) / ITERATIONS
+
     # --- KRYONIX (No Compression) ---
     schema_nc = Schema(
         name="UserNC",
@@ -149,6 +163,7 @@ def benchmark():
     
     # Kryonix
     print(f"{'Kryonix (Comp)':<20} | {len(k_bin):<12} | {k_ser_time*1000:<15.4f} | {k_des_time*1000:<15.4f}")
+    print(f"{'Kryonix (Record)':<20} | {len(kr_bin):<12} | {kr_ser_time*1000:<15.4f} | {kr_des_time*1000:<15.4f}")
     print(f"{'Kryonix (Raw)':<20} | {len(knc_bin):<12} | {knc_ser_time*1000:<15.4f} | {knc_des_time*1000:<15.4f}")
     print(f"{'Kryonix (JIT)':<20} | {len(kjit_bin):<12} | {kjit_ser_time*1000:<15.4f} | {'N/A':<15}")
     
@@ -0,0 +1,124 @@
+import time
+import multiprocessing as mp
+from kryonix import AdvancedSerializer, SharedRingBuffer, Schema, Field, INT, STRING, LIST
+
+SCHEMA = Schema(
+    name="Event",
+    version=1,
+    fields=[
+        Field("id", INT),
+        Field("event_type", STRING),
+        Field("payload", STRING),
+        Field("metrics", LIST),
+    ]
+)
+
+RECORDS = 100000
+WORKERS = 4
+BATCH = 64
+
+def pipe_worker(conn, results):
+    serializer = AdvancedSerializer()
+    count = 0
+    while True:
+        batch = conn.recv()
+        if batch is None:
+            break
+        for data in batch:
+            serializer.deserialize(SCHEMA, data)
+            count += 1
+    results.put(count)
+
+def ring_worker(ring, results):
+    serializer = AdvancedSerializer()
+    count = 0
+    while True:
+        views = ring.consume_batch(BATCH)
+        if not views:
+            break
+        for view in views:
+            serializer.deserialize(SCHEMA, view)
+            count += 1
+        ring.release()
+    ring.close()
+    results.put(count)
+
+def run_pipes(payloads):
+    results = mp.Queue()
+    conns, procs = [], []
+    for _ in range(WORKERS):
+        parent, child = mp.Pipe()
+        p = mp.Process(target=pipe_worker, args=(child, results))
+        p.start()
+        conns.append(parent)
+        procs.append(p)
+
+    start = time.time()
+    for i in range(0, len(payloads), BATCH):
+        conns[(i // BATCH) % WORKERS].send(payloads[i:i+BATCH])
+    for conn in conns:
+        conn.send(None)
+    total = sum(results.get() for _ in procs)
+    elapsed = time.time() - start
+
+    for p in procs:
+        p.join()
+    return total, elapsed
+
+def run_ring(payloads):
+    results = mp.Queue()
+    ring = SharedRingBuffer(slots=1024, slot_size=max(map(len, payloads)))
+    procs = [mp.Process(target=ring_worker, args=(ring, results)) for _ in range(WORKERS)]
+    for p in procs:
+        p.start()
+
+    start = time.time()
+    for i in range(0, len(payloads), BATCH):
+        ring.publish_batch(payloads[i:i+BATCH])
+    ring.finish()
+    total = sum(results.get() for _ in procs)
+    elapsed = time.time() - start
+
+    for p in procs:
+        p.join()
+    ring.close()
+    return total, elapsed
+
+def benchmark():
+    print("="*60)
+    print("🚀 KRYONIX TRANSPORT BENCHMARK")
+    print("="*60)
+
+    serializer = AdvancedSerializer()
+
+    print(f"\n📊 Fanning out {RECORDS} records to {WORKERS} workers...\n")
+    print(f"{'TRANSPORT':<20} | {'RECORD (Bytes)':<14} | {'TIME (s)':<10} | {'RECORDS/s':<12}")
+    print("-" * 65)
+
+    speedups = []
+    for repeat in (4, 200):
+        payloads = [
+            serializer.serialize(SCHEMA, {
+                "id": i,
+                "event_type": "user_signup",
+                "payload": "User signed up with email example@domain.com. " * repeat,
+                "metrics": [i, i + 1, i + 2],
+            })
+            for i in range(RECORDS)
+        ]
+        size = len(payloads[0])
+
+        p_total, p_time = run_pipes(payloads)
+        r_total, r_time = run_ring(payloads)
+        assert p_total == r_total == RECORDS
+
+        print(f"{'Pipes':<20} | {size:<14} | {p_time:<10.4f} | {RECORDS / p_time:<12.0f}")
+        print(f"{'Shared Ring':<20} | {size:<14} | {r_time:<10.4f} | {RECORDS / r_time:<12.0f}")
+        speedups.append((size, p_time / r_time))
+
+    print("\n🏆 SUMMARY:")
+    for size, speedup in speedups:
+        print(f"{size}-byte records: shared ring buffer is {speedup:.2f}x speed of pipes.")
+
+if __name__ == "__main__":
+    benchmark()
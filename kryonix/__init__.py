@@ -1,3 +1,5 @@
 from .core import *
 from .schema import *
 from .serializer import *
+from .columnar import *
+from .ring import *
@@ -0,0 +1,219 @@
+import os
+import time
+from array import array
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from typing import Iterable, List, Optional
+
+# Control words (int64): head, tail, finished
+_HEAD = 0
+_TAIL = 1
+_FINISHED = 2
+_CTRL_WORDS = 3
+
+# Slot states, one byte per slot
+_EMPTY = 0
+_FULL = 1
+_CLAIMED = 2
+
+def _align(n: int) -> int:
+    # Cache-line align regions
+    return (n + 63) & ~63
+
+class SharedRingBuffer:
+    """Single-producer / multi-consumer ring of fixed-size slots in shared memory.
+
+    The producer copies serialized records straight into slots; consumers
+    get memoryviews over their slots and decode in place, then ``release()``
+    them. The producer blocks while the next slot is still in use.
+
+    Pass the ring to worker processes as a ``Process`` argument; the
+    shared lock can only be handed over while spawning.
+    """
+
+    def __init__(self, slots: int = 1024, slot_size: int = 4096, ctx=None):
+        if slots <= 0 or slot_size <= 0:
+            raise ValueError("slots and slot_size must be positive")
+        self.slots = slots
+        self.slot_size = slot_size
+
+        # Layout: control words | slot states (B) | slot lengths (I) | slot data
+        self._states_offset = _align(8 * _CTRL_WORDS)
+        self._lengths_offset = _align(self._states_offset + slots)
+        self._data_offset = _align(self._lengths_offset + 4 * slots)
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=self._data_offset + slots * slot_size)
+        self._shm.buf[:self._data_offset] = bytes(self._data_offset)
+        self._owner_pid = os.getpid()
+        self._cond = (ctx or mp).Condition()
+        self._attach()
+
+    def _attach(self):
+        buf = self._shm.buf
+        self._ctrl = buf[:8 * _CTRL_WORDS].cast('q')
+        self._states = buf[self._states_offset:self._states_offset + self.slots]
+        self._lengths = buf[self._lengths_offset:self._lengths_offset + 4 * self.slots].cast('I')
+        self._data = buf[self._data_offset:]
+        self._full = bytes([_FULL]) * self.slots
+        self._empty = bytes([_EMPTY]) * self.slots
+        self._claimed_marks = bytes([_CLAIMED]) * self.slots
+        self._claimed = []
+        self._views = []
+        self._closed = False
+
+    def __getstate__(self):
+        return {
+            'name': self._shm.name,
+            'slots': self.slots,
+            'slot_size': self.slot_size,
+            'states_offset': self._states_offset,
+            'lengths_offset': self._lengths_offset,
+            'data_offset': self._data_offset,
+            'cond': self._cond,
+        }
+
+    def __setstate__(self, state):
+        self.slots = state['slots']
+        self.slot_size = state['slot_size']
+        self._states_offset = state['states_offset']
+        self._lengths_offset = state['lengths_offset']
+        self._data_offset = state['data_offset']
+        self._cond = state['cond']
+        self._shm = shared_memory.SharedMemory(name=state['name'])
+        self._owner_pid = None
+        self._attach()
+
+    # --- Producer ---
+
+    def publish(self, payload: bytes, timeout: Optional[float] = None) -> None:
+        self.publish_batch((payload,), timeout)
+
+    def publish_batch(self, payloads: Iterable[bytes], timeout: Optional[float] = None) -> None:
+        """Publish payloads in order, blocking while the ring is full.
+
+        Each round takes the run of free slots ahead of the producer under
+        one lock acquisition, fills it outside the lock, then makes the
+        whole run visible to consumers at once.
+
+        ``timeout`` bounds the whole call. Runs published before it expires
+        stay visible to consumers, so the ``TimeoutError`` carries a
+        ``published`` count; retry with ``payloads[err.published:]``.
+        """
+        ctrl = self._ctrl
+        states = self._states
+        lengths = self._lengths
+        data = self._data
+        cond = self._cond
+        slots = self.slots
+        slot_size = self.slot_size
+
+        pending = payloads if isinstance(payloads, (list, tuple)) else list(payloads)
+        sizes = array('I', map(len, pending))
+        if sizes and max(sizes) > slot_size:
+            raise ValueError(f"Payload of {max(sizes)} bytes exceeds slot size {slot_size}")
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        i = 0
+        total = len(pending)
+        while i < total:
+            with cond:
+                head = ctrl[_HEAD]
+                first = head % slots
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                if not cond.wait_for(lambda: states[first] == _EMPTY, remaining):
+                    err = TimeoutError(f"Ring buffer full after publishing {i} of {total} payloads")
+                    err.published = i
+                    raise err
+                # Free run ahead of head, without wrapping past the ring end
+                stop = min(first + total - i, slots)
+                run = stop - first - len(states[first:stop].tobytes().lstrip(self._empty[:1]))
+
+            # Only the producer writes EMPTY slots, so fill them without the lock
+            start = first * slot_size
+            for p in pending[i:i + run]:
+                data[start:start + len(p)] = p
+                start += slot_size
+            lengths[first:first + run] = sizes[i:i + run]
+
+            with cond:
+                states[first:first + run] = self._full[:run]
+                ctrl[_HEAD] = head + run
+                cond.notify_all()
+            i += run
+
+    def finish(self) -> None:
+        """Signal end of stream; consumers drain the ring and then get nothing."""
+        with self._cond:
+            self._ctrl[_FINISHED] = 1
+            self._cond.notify_all()
+
+    # --- Consumers ---
+
+    def consume(self, timeout: Optional[float] = None) -> Optional[memoryview]:
+        views = self.consume_batch(1, timeout)
+        return views[0] if views else None
+
+    def consume_batch(self, max_items: int, timeout: Optional[float] = None) -> List[memoryview]:
+        """Claim up to ``max_items`` published payloads as memoryviews.
+
+        Blocks until at least one is available. Returns an empty list once
+        the producer has finished and the ring is drained. The views stay
+        valid until ``release()``.
+        """
+        if max_items <= 0:
+            raise ValueError("max_items must be positive")
+        ctrl = self._ctrl
+        states = self._states
+        cond = self._cond
+        slots = self.slots
+        slot_size = self.slot_size
+
+        with cond:
+            if not cond.wait_for(
+                    lambda: ctrl[_TAIL] < ctrl[_HEAD] or ctrl[_FINISHED], timeout):
+                raise TimeoutError("Ring buffer empty")
+            tail = ctrl[_TAIL]
+            first = tail % slots
+            # Claim a run of published slots, without wrapping past the ring end
+            run = min(max_items, ctrl[_HEAD] - tail, slots - first)
+            if run <= 0:
+                return []
+            ctrl[_TAIL] = tail + run
+            states[first:first + run] = self._claimed_marks[:run]
+
+        data = self._data
+        start = first * slot_size
+        views = []
+        for length in self._lengths[first:first + run].tolist():
+            views.append(data[start:start + length])
+            start += slot_size
+        self._claimed.append((first, run))
+        self._views += views
+        return views
+
+    def release(self) -> None:
+        """Hand every slot claimed since the last release back to the producer."""
+        if not self._claimed:
+            return
+        for v in self._views:
+            v.release()
+        with self._cond:
+            for first, run in self._claimed:
+                self._states[first:first + run] = self._empty[:run]
+            self._cond.notify_all()
+        self._claimed = []
+        self._views = []
+
+    # --- Lifetime ---
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self.release()
+        for view in (self._ctrl, self._states, self._lengths, self._data):
+            view.release()
+        self._shm.close()
+        # Forked workers inherit the producer's object; only the creator unlinks
+        if self._owner_pid == os.getpid():
+            self._shm.unlink()
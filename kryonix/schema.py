@@ -14,3 +14,6 @@ class Schema:
     name: str
     version: int
     fields: List[Field]
+    # Whole-record compression: applied to the body once it reaches the threshold
+    record_codec: int = CODEC_NONE
+    record_threshold: int = 0
@@ -2,18 +2,20 @@ import struct
 import zstandard as zstd
 import brotli
 import sys
-from typing import Any, Dict
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 from .core import *
 from .schema import Schema, Field
 
 class AdvancedSerializer:
-    def __init__(self):
+    def __init__(self, zstd_dict: Optional[zstd.ZstdCompressionDict] = None):
         # Pre-compile structs for performance
         self._struct_H = struct.Struct(">H")
         self._struct_I = struct.Struct(">I")
         self._struct_q = struct.Struct(">q")
         self._struct_d = struct.Struct(">d")
         self._struct_header = struct.Struct(">4sH") # Magic + Version
+        self._struct_record_header = struct.Struct(">4sHB") # Magic + Version + Record Codec
         
         # Cache codecs
         self._zstd_compress = zstd.compress
@@ -21,12 +23,49 @@ class AdvancedSerializer:
         self._brotli_compress = brotli.compress
         self._brotli_decompress = brotli.decompress
 
-    def serialize(self, schema: Schema, obj: Dict[str, Any]) -> bytes:
-        out = bytearray()
-        
-        # Write header: Magic (4) + Version (2)
-        out += self._struct_header.pack(b'AXSR', schema.version)
+        # Whole-record zstd, optionally primed with a trained dictionary.
+        # zstd (de)compressor objects are not thread-safe, so each thread
+        # builds its own from the dictionary, which is prepared once here.
+        self._zstd_dict = zstd_dict
+        self._zstd_local = threading.local()
+        if zstd_dict is not None:
+            zstd_dict.precompute_compress(level=3)
+
+    def serialize(self, schema: Schema, obj: Dict[str, Any],
+                  record_codec: Optional[int] = None,
+                  record_threshold: Optional[int] = None) -> bytes:
+        if record_codec is None:
+            record_codec = schema.record_codec
+        if record_codec == CODEC_NONE:
+            out = bytearray(self._struct_header.pack(b'AXSR', schema.version))
+            self._encode_fields(schema, obj, out)
+            return bytes(out)
+        if record_codec not in (CODEC_ZSTD, CODEC_BROTLI):
+            raise NotImplementedError(f"Unknown codec: {record_codec}")
+
+        if record_threshold is None:
+            record_threshold = schema.record_threshold
 
+        # Encode every field once; compress the body as a whole or per field
+        chunks = self._encode_raw(schema, obj)
+        body_size = 6 * len(chunks) + sum(len(c) for c in chunks if c is not None)
+        if body_size < record_threshold:
+            # Too small to pay for a frame: fall back to per-field codecs
+            out = bytearray(self._struct_header.pack(b'AXSR', schema.version))
+            self._pack_fields(schema, chunks, out, True)
+            return bytes(out)
+
+        body = bytearray()
+        self._pack_fields(schema, chunks, body, False)
+        if record_codec == CODEC_ZSTD:
+            compressed = self._record_zstd_compress(body)
+        else:
+            compressed = self._brotli_compress(bytes(body))
+
+        # Write header: Magic (4) + Version (2) + Record Codec (1)
+        return self._struct_record_header.pack(b'AXSC', schema.version, record_codec) + compressed
+
+    def _encode_fields(self, schema: Schema, obj: Dict[str, Any], out: bytearray) -> None:
         # Localize lookups
         pack_H = self._struct_H.pack
         pack_I = self._struct_I.pack
@@ -79,29 +118,56 @@ class AdvancedSerializer:
             out += pack_I(len(encoded))
             out += encoded
 
-        return bytes(out)
+    def _encode_raw(self, schema: Schema, obj: Dict[str, Any]) -> List[Optional[bytes]]:
+        # Uncompressed value bytes per field; None for a missing optional field
+        chunks = []
+        primitive_encode = self._primitive_encode
+        for field in schema.fields:
+            value = obj.get(field.name)
+            if value is None:
+                if not field.optional:
+                    raise ValueError(f"Missing required field: {field.name}")
+                chunks.append(None)
+            else:
+                chunks.append(primitive_encode(field.type, value))
+        return chunks
+
+    def _pack_fields(self, schema: Schema, chunks: List[Optional[bytes]], out: bytearray,
+                     use_codecs: bool) -> None:
+        # Localize lookups
+        pack_H = self._struct_H.pack
+        pack_I = self._struct_I.pack
+
+        for field, raw in zip(schema.fields, chunks):
+            # Compression (skipped when the whole record is compressed)
+            codec = field.codec if use_codecs else CODEC_NONE
+            if raw is None:
+                encoded = b''
+            elif codec == CODEC_NONE:
+                encoded = raw
+            elif codec == CODEC_ZSTD:
+                encoded = self._zstd_compress(raw)
+            elif codec == CODEC_BROTLI:
+                encoded = self._brotli_compress(raw)
+            else:
+                raise NotImplementedError(f"Unknown codec: {codec}")
+
+            # Field header: type + length
+            out += pack_H(field.type)
+            out += pack_I(len(encoded))
+            out += encoded
 
     def deserialize(self, schema: Schema, data: bytes) -> Dict[str, Any]:
-        obj = {}
-        offset = 0
-        
-        # Read Header
-        if data[0:4] != b'AXSR':
-             raise ValueError("Invalid magic bytes")
-        offset += 4
-        
-        version = self._struct_H.unpack_from(data, offset)[0]
-        offset += 2
+        data, offset, use_codecs = self._unwrap_record(data)
         
-        if version != schema.version:
-             pass
-
         # Localize lookups
         unpack_H = self._struct_H.unpack_from
         unpack_I = self._struct_I.unpack_from
         unpack_q = self._struct_q.unpack_from
         unpack_d = self._struct_d.unpack_from
         
+        obj = {}
+        
         # Read Fields
         for field in schema.fields:
             if offset >= len(data):
@@ -123,7 +189,7 @@ class AdvancedSerializer:
                 
             # INLINE _decode_value logic
             # 1. Decompress
-            codec = field.codec
+            codec = field.codec if use_codecs else CODEC_NONE
             if codec == CODEC_NONE:
                 raw = content
             elif codec == CODEC_ZSTD:
@@ -142,7 +208,7 @@ class AdvancedSerializer:
                 val = (raw == b'\x01')
             elif ftype == STRING:
                 l = unpack_I(raw, 0)[0]
-                val = raw[4:4+l].decode('utf8')
+                val = str(raw[4:4+l], 'utf8')
             elif ftype == LIST:
                 val = self._decode_list(raw)
             else:
@@ -152,6 +218,55 @@ class AdvancedSerializer:
                 
         return obj
 
+    def _record_zstd_compress(self, data) -> bytes:
+        if self._zstd_dict is None:
+            return self._zstd_compress(data)
+        local = self._zstd_local
+        compressor = getattr(local, 'compressor', None)
+        if compressor is None:
+            compressor = local.compressor = zstd.ZstdCompressor(dict_data=self._zstd_dict)
+        return compressor.compress(data)
+
+    def _record_zstd_decompress(self, data) -> bytes:
+        if self._zstd_dict is None:
+            return self._zstd_decompress(data)
+        local = self._zstd_local
+        decompressor = getattr(local, 'decompressor', None)
+        if decompressor is None:
+            decompressor = local.decompressor = zstd.ZstdDecompressor(dict_data=self._zstd_dict)
+        return decompressor.decompress(data)
+
+    def _unwrap_record(self, data: bytes) -> Tuple[bytes, int, bool]:
+        # Returns the buffer holding the field stream, the offset of the
+        # first field, and whether per-field codecs apply.
+        magic = data[0:4]
+        if magic == b'AXSR':
+            return data, self._struct_header.size, True
+        if magic != b'AXSC':
+             raise ValueError("Invalid magic bytes")
+
+        _, _, record_codec = self._struct_record_header.unpack_from(data, 0)
+        body = data[self._struct_record_header.size:]
+        if record_codec == CODEC_ZSTD:
+            return self._record_zstd_decompress(body), 0, False
+        if record_codec == CODEC_BROTLI:
+            return self._brotli_decompress(body), 0, False
+        raise NotImplementedError(f"Unknown codec: {record_codec}")
+
+    def train_dictionary(self, schema: Schema, samples: List[Dict[str, Any]],
+                         dict_size: int = 16384) -> zstd.ZstdCompressionDict:
+        """Train a zstd dictionary on uncompressed record bodies of ``schema``.
+
+        Pass the result to ``AdvancedSerializer(zstd_dict=...)`` on both the
+        writing and the reading side.
+        """
+        bodies = []
+        for obj in samples:
+            body = bytearray()
+            self._pack_fields(schema, self._encode_raw(schema, obj), body, False)
+            bodies.append(bytes(body))
+        return zstd.train_dictionary(dict_size, bodies)
+
     # Kept for compatibility if needed, but unused in main path
     def _encode_value(self, field: Field, value: Any) -> bytes:
         pass 
@@ -182,7 +297,7 @@ class AdvancedSerializer:
             return data == b'\x01'
         if t == STRING:
             l = self._struct_I.unpack_from(data, 0)[0]
-            return data[4:4+l].decode('utf8')
+            return str(data[4:4+l], 'utf8')
         if t == LIST:
             return self._decode_list(data)
         raise NotImplementedError
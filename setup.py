@@ -10,5 +10,8 @@ setup(
         "zstandard",
         "brotli",
     ],
+    extras_require={
+        "numpy": ["numpy"],
+    },
     python_requires=">=3.7",
 )
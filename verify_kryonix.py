@@ -40,5 +40,237 @@ def test_kryonix():
     
     print("Verification Successful!")
 
+def test_decode_columns():
+    try:
+        import numpy
+    except ImportError:
+        print("Skipping columnar check (numpy not installed)")
+        return
+    from kryonix import decode_columns, FLOAT, BOOL
+
+    print("Testing columnar decode...")
+    schema = Schema(
+        name="Mixed",
+        version=1,
+        fields=[
+            Field("id", INT),
+            Field("score", FLOAT),
+            Field("name", STRING),
+            Field("count", INT),
+            Field("active", BOOL),
+            Field("bio", STRING, codec=CODEC_ZSTD),
+            Field("ratio", FLOAT),
+        ]
+    )
+    s = AdvancedSerializer()
+    payloads = [
+        s.serialize(schema, {
+            "id": i,
+            "score": i * 0.5,
+            "name": "user" * (i % 5),
+            "count": -i,
+            "active": i % 2 == 0,
+            "bio": f"bio {i}",
+            "ratio": i / 7,
+        })
+        for i in range(100)
+    ]
+
+    columns = decode_columns(schema, payloads)
+    for i, data in enumerate(payloads):
+        for name, value in s.deserialize(schema, data).items():
+            assert columns[name][i] == value, (name, i)
+    assert columns["count"].dtype == numpy.int64
+    assert columns["ratio"].dtype == numpy.float64
+
+    print("Columnar Verification Successful!")
+
+def test_record_compression():
+    print("Testing whole-record compression...")
+    import zstandard
+    from kryonix import CODEC_NONE
+
+    schema = Schema(
+        name="Cached",
+        version=1,
+        fields=[
+            Field("id", INT),
+            Field("name", STRING, codec=CODEC_ZSTD),
+            Field("email", STRING),
+            Field("bio", STRING, codec=CODEC_BROTLI),
+        ],
+        record_codec=CODEC_ZSTD,
+        record_threshold=64,
+    )
+    records = [
+        {
+            "id": i,
+            "name": f"user {i}",
+            "email": f"user{i}@example.com",
+            "bio": f"user {i} writes python at example.com",
+        }
+        for i in range(500)
+    ]
+    data = records[0]
+    s = AdvancedSerializer()
+
+    # Schema-level zstd and per-call brotli record modes
+    binary = s.serialize(schema, data)
+    assert binary[:4] == b'AXSC' and binary[6] == CODEC_ZSTD
+    assert s.deserialize(schema, binary) == data
+    binary = s.serialize(schema, data, record_codec=CODEC_BROTLI)
+    assert binary[:4] == b'AXSC' and binary[6] == CODEC_BROTLI
+    assert s.deserialize(schema, binary) == data
+
+    # Per-call override back to per-field codecs
+    binary = s.serialize(schema, data, record_codec=CODEC_NONE)
+    assert binary[:4] == b'AXSR'
+    assert s.deserialize(schema, binary) == data
+
+    # Below the threshold the record keeps per-field codecs
+    binary = s.serialize(schema, data, record_threshold=10000)
+    assert binary[:4] == b'AXSR'
+    assert binary == s.serialize(schema, data, record_codec=CODEC_NONE)
+    assert s.deserialize(schema, binary) == data
+
+    # An unknown record codec is rejected whatever the record size
+    for threshold in (0, 10000):
+        try:
+            s.serialize(schema, data, record_codec=99, record_threshold=threshold)
+        except NotImplementedError:
+            pass
+        else:
+            raise AssertionError("Expected an unknown record codec to be rejected")
+
+    # Trained dictionary on both sides
+    zdict = s.train_dictionary(schema, records, dict_size=2048)
+    writer = AdvancedSerializer(zstd_dict=zdict)
+    reader = AdvancedSerializer(zstd_dict=zdict)
+    binary = writer.serialize(schema, data)
+    assert binary[:4] == b'AXSC'
+    assert reader.deserialize(schema, binary) == data
+
+    # Columnar decode needs a serializer with the writer's dictionary
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    if numpy is not None:
+        from kryonix import decode_columns
+        payloads = [writer.serialize(schema, r) for r in records[:50]]
+        columns = decode_columns(schema, payloads, serializer=reader)
+        for i, record in enumerate(records[:50]):
+            for name, value in record.items():
+                assert columns[name][i] == value, (name, i)
+
+    # One dictionary serializer shared across threads
+    import threading
+    shared = AdvancedSerializer(zstd_dict=zdict)
+    errors = []
+
+    def round_trip():
+        try:
+            for _ in range(5):
+                for record in records[:100]:
+                    assert shared.deserialize(schema, shared.serialize(schema, record)) == record
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=round_trip) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors, errors
+
+    # A reader without the dictionary cannot decode it
+    try:
+        s.deserialize(schema, binary)
+    except zstandard.ZstdError as e:
+        assert "Dictionary mismatch" in str(e)
+    else:
+        raise AssertionError("Expected a dictionary mismatch")
+
+    print("Record Compression Verification Successful!")
+
+RING_SCHEMA = Schema(
+    name="Job",
+    version=1,
+    fields=[
+        Field("id", INT),
+        Field("name", STRING),
+        Field("tags", LIST),
+    ]
+)
+
+def _ring_worker(ring, results):
+    s = AdvancedSerializer()
+    ids = []
+    while True:
+        views = ring.consume_batch(8)
+        if not views:
+            break
+        for view in views:
+            # Decode in place from the shared-memory memoryview
+            job = s.deserialize(RING_SCHEMA, view)
+            assert job["name"] == f"job {job['id']}"
+            ids.append(job["id"])
+        ring.release()
+    ring.close()
+    results.put(ids)
+
+def test_shared_ring():
+    print("Testing shared ring buffer...")
+    import multiprocessing as mp
+    from kryonix import SharedRingBuffer
+
+    # Small ring so the producer wraps around and waits on workers
+    ring = SharedRingBuffer(slots=16, slot_size=256)
+    results = mp.Queue()
+    workers = [mp.Process(target=_ring_worker, args=(ring, results)) for _ in range(3)]
+    for w in workers:
+        w.start()
+
+    s = AdvancedSerializer()
+    count = 2000
+    payloads = [
+        s.serialize(RING_SCHEMA, {"id": i, "name": f"job {i}", "tags": ["a", i]})
+        for i in range(count)
+    ]
+    for i in range(0, count, 50):
+        ring.publish_batch(payloads[i:i+50])
+    ring.finish()
+
+    received = []
+    for _ in workers:
+        received += results.get()
+    for w in workers:
+        w.join()
+    ring.close()
+    ring.close()
+    # Every record went to exactly one worker
+    assert sorted(received) == list(range(count))
+
+    # A batch timeout reports how many payloads went out
+    ring = SharedRingBuffer(slots=2, slot_size=16)
+    try:
+        ring.publish_batch([b"a", b"b", b"c"], timeout=0.1)
+    except TimeoutError as e:
+        assert e.published == 2
+    else:
+        raise AssertionError("Expected the full ring to time out")
+    try:
+        ring.consume_batch(0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected max_items to be validated")
+    ring.close()
+
+    print("Shared Ring Verification Successful!")
+
 if __name__ == "__main__":
     test_kryonix()
+    test_decode_columns()
+    test_record_compression()
+    test_shared_ring()